@@ -1,72 +1,123 @@
 """OAuth2 authentication for Calsinki calendar synchronization service."""
 
+import functools
 import json
-import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar
 
-import qrcode
-from google.auth.exceptions import RefreshError
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
+from .config import (
+    get_credentials_path,
+    get_oauth2_config_path,
+    get_yaml_loader,
+    write_private_file,
+)
 
-from .config import get_credentials_path, get_oauth2_config_path
+if TYPE_CHECKING:
+    # google-auth and qrcode are imported where they're used, so loading the
+    # OAuth2 config alone doesn't pull in the auth stack.
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
 
 
-@dataclass
+DEFAULT_SCOPES: tuple[str, ...] = (
+    "https://www.googleapis.com/auth/calendar.readonly",  # Read calendar metadata and events
+    "https://www.googleapis.com/auth/calendar.events",  # Read/write calendar events
+)
+
+# Rule printed above and below the terminal QR code; matches the CLI's
+# section banner (calsinki.cli._BANNER)
+_QR_BANNER = "=" * 50
+
+# Connections kept open for token refreshes; also the most accounts
+# `auth --parallel` refreshes at once
+REFRESH_POOL_SIZE = 8
+
+
+@dataclass(slots=True, frozen=True)
 class OAuth2Config:
     """OAuth2 configuration for Google API authentication."""
 
     client_id: str
     client_secret: str
-    scopes: list[str] = field(
-        default_factory=lambda: [
-            "https://www.googleapis.com/auth/calendar.readonly",  # Read calendar metadata and events
-            "https://www.googleapis.com/auth/calendar.events",  # Read/write calendar events
-        ]
-    )
+    scopes: tuple[str, ...] = DEFAULT_SCOPES
 
 
 class GoogleAuthenticator:
     """Handles Google OAuth2 authentication for calendar access."""
 
+    # Credentials already loaded or obtained in this process, by file path
+    _credentials_cache: ClassVar[dict[Path, "Credentials"]] = {}
+
     def __init__(self, account_name: str, oauth2_config: OAuth2Config):
         self.account_name = account_name
         self.oauth2_config = oauth2_config
         self.credentials_path = get_credentials_path(account_name)
 
-    def authenticate(self) -> Credentials:
-        """Authenticate with Google using OAuth2 device flow."""
-        credentials = self._load_existing_credentials()
+    def authenticate(
+        self, interactive: bool = True, skip_saved: bool = False
+    ) -> "Credentials | None":
+        """Authenticate with Google using OAuth2 device flow.
+
+        With interactive=False, saved credentials are loaded and refreshed
+        but None is returned instead of prompting the user for consent. With
+        skip_saved=True, saved credentials are ignored and the user is asked
+        to sign in again.
+        """
+        from google.auth.exceptions import RefreshError
+
+        credentials = None
+        if not skip_saved:
+            credentials = self._credentials_cache.get(self.credentials_path)
+            if credentials is None:
+                credentials = self._load_existing_credentials()
 
         if credentials and credentials.valid:
+            self._credentials_cache[self.credentials_path] = credentials
             return credentials
 
         if credentials and credentials.expired and credentials.refresh_token:
             try:
-                credentials.refresh(Request())
+                credentials.refresh(_get_refresh_transport())
                 self._save_credentials(credentials)
+                self._credentials_cache[self.credentials_path] = credentials
                 return credentials
             except RefreshError:
                 print(
                     f"⚠️  Refresh token expired for {self.account_name}, re-authenticating..."
                 )
 
-        return self._perform_device_flow()
+        if not interactive:
+            return None
+
+        credentials = self._perform_device_flow()
+        self._credentials_cache[self.credentials_path] = credentials
+        return credentials
 
-    def _load_existing_credentials(self) -> Credentials | None:
+    def _load_existing_credentials(self) -> "Credentials | None":
         """Load existing credentials from file."""
         if not self.credentials_path.exists():
             return None
 
         try:
-            with open(self.credentials_path) as f:
-                creds_data = json.load(f)
+            creds_data = json.loads(self.credentials_path.read_bytes())
+
+            # Unusable credentials lead to re-authentication either way, so
+            # don't load google-auth just to find that out
+            if not creds_data.get("refresh_token") and (
+                not creds_data.get("token") or _token_expired(creds_data)
+            ):
+                return None
+
+            from google.oauth2.credentials import Credentials
+
             return Credentials.from_authorized_user_info(creds_data)
         except Exception as e:
             print(f"⚠️  Error loading credentials for {self.account_name}: {e}")
             return None
 
-    def _save_credentials(self, credentials: Credentials):
+    def _save_credentials(self, credentials: "Credentials"):
         """Save credentials to file."""
         self.credentials_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -78,14 +129,21 @@ class GoogleAuthenticator:
             "client_secret": credentials.client_secret,
             "scopes": credentials.scopes,
         }
+        # Same format as google-auth's Credentials.to_json(): naive UTC with a
+        # "Z" suffix. Without it, loaded credentials never look expired, so
+        # they would be used stale instead of refreshed.
+        if credentials.expiry is not None:
+            creds_data["expiry"] = credentials.expiry.isoformat() + "Z"
+
+        # Compact JSON; this file is machine-managed, not meant for hand edits.
+        # Written atomically and created with 0600, so the token is never
+        # briefly world-readable.
+        write_private_file(
+            self.credentials_path,
+            json.dumps(creds_data, separators=(",", ":")).encode("utf-8"),
+        )
 
-        with open(self.credentials_path, "w") as f:
-            json.dump(creds_data, f, indent=2)
-
-        # Set restrictive permissions on credentials file
-        os.chmod(self.credentials_path, 0o600)
-
-    def _perform_device_flow(self) -> Credentials:
+    def _perform_device_flow(self) -> "Credentials":
         """Perform OAuth2 authentication for desktop applications using base Flow class."""
         print(f"🔐 Starting OAuth2 authentication for {self.account_name}...")
 
@@ -102,7 +160,7 @@ class GoogleAuthenticator:
                     "redirect_uris": ["urn:ietf:wg:oauth:2.0:oob"],
                 }
             },
-            scopes=self.oauth2_config.scopes,
+            scopes=list(self.oauth2_config.scopes),
         )
 
         # Set the redirect URI explicitly
@@ -150,7 +208,7 @@ class GoogleAuthenticator:
             print(f"❌ Authentication failed for {self.account_name}: {e}")
             raise
 
-    def _try_local_server_flow(self) -> Credentials:
+    def _try_local_server_flow(self) -> "Credentials":
         """Fallback to local server flow for desktop applications."""
         # This method is no longer needed as we use the correct installed app flow
         pass
@@ -158,17 +216,19 @@ class GoogleAuthenticator:
     def _display_qr_code(self, auth_url: str):
         """Display QR code containing the authorization URL."""
         try:
-            # Generate QR code
-            qr = qrcode.QRCode(version=1, box_size=2, border=2)
-            qr.add_data(auth_url)
-            qr.make(fit=True)
-
-            # Display QR code in terminal using qrcode's built-in method
-            print("📱 QR Code for Mobile Authentication:")
-            print("=" * 50)
-            qr.print_ascii(invert=True)
-            print("=" * 50)
-            print("📱 Scan this QR code with your mobile device")
+            from .qr import render_qr_ascii
+
+            # Generate QR code (libqrencode when available, qrcode otherwise)
+            qr_ascii = render_qr_ascii(auth_url, border=2)
+
+            # Display QR code in terminal
+            print(
+                "📱 QR Code for Mobile Authentication:",
+                _QR_BANNER,
+                f"{qr_ascii}{_QR_BANNER}",
+                "📱 Scan this QR code with your mobile device",
+                sep="\n",
+            )
 
         except Exception as e:
             print(f"⚠️  Could not generate QR code: {e}")
@@ -202,10 +262,96 @@ google_oauth2:
     return config_path
 
 
-def load_oauth2_config() -> OAuth2Config | None:
-    """Load OAuth2 configuration from file."""
+@functools.cache
+def _get_refresh_transport() -> "Request":
+    """Get the transport shared by all token refreshes in this process.
+
+    Refreshes reuse one pooled HTTPS session instead of opening a new
+    connection each time; the pool holds a connection for each of the
+    REFRESH_POOL_SIZE concurrent `auth --parallel` workers.
+    """
+    import requests
+    from google.auth.transport.requests import Request
+
+    session = requests.Session()
+    session.mount(
+        "https://",
+        requests.adapters.HTTPAdapter(
+            pool_connections=REFRESH_POOL_SIZE, pool_maxsize=REFRESH_POOL_SIZE
+        ),
+    )
+    return Request(session=session)
+
+
+def _token_expired(creds_data: dict[str, Any]) -> bool:
+    """Check a saved token's expiry without constructing Credentials."""
+    expiry = creds_data.get("expiry")
+    if not expiry:
+        return False
+
+    # Saved as naive UTC ISO-8601 with a "Z" suffix (see _save_credentials)
+    try:
+        expiry_time = datetime.fromisoformat(expiry.rstrip("Z"))
+    except (AttributeError, ValueError):
+        return False
+    if expiry_time.tzinfo is not None:
+        expiry_time = expiry_time.astimezone(UTC).replace(tzinfo=None)
+
+    return expiry_time <= datetime.now(UTC).replace(tzinfo=None)
+
+
+def _read_oauth2_config_data(config_path: Path, mtime_ns: int, size: int) -> Any:
+    """Read the OAuth2 YAML, reusing its JSON sidecar cache when up to date."""
     import yaml
 
+    cache_path = config_path.with_suffix(".yaml.json")
+
+    # The sidecar records the modification time and size of the YAML it was
+    # made from, and is only trusted while both still match. Comparing mtimes
+    # alone would miss an older file restored with its original timestamp.
+    try:
+        with open(cache_path, "rb") as f:
+            cached = json.load(f)
+        if cached.get("mtime_ns") == mtime_ns and cached.get("size") == size:
+            return cached["data"]
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+
+    with open(config_path) as f:
+        config_data = yaml.load(f, Loader=get_yaml_loader())
+
+    # Caching is best-effort; a failed write just means parsing YAML next time
+    try:
+        write_private_file(
+            cache_path,
+            json.dumps(
+                {"mtime_ns": mtime_ns, "size": size, "data": config_data}
+            ).encode("utf-8"),
+        )
+    except (OSError, TypeError):
+        pass
+
+    return config_data
+
+
+@functools.lru_cache(maxsize=8)
+def _load_oauth2_config_file(
+    config_path: str, mtime_ns: int, size: int
+) -> OAuth2Config:
+    """Build an OAuth2Config from file; cached by path, modification time and size."""
+    config_data = _read_oauth2_config_data(Path(config_path), mtime_ns, size)
+
+    oauth2_data = config_data.get("google_oauth2", {})
+    scopes = oauth2_data.get("scopes")
+    return OAuth2Config(
+        client_id=oauth2_data["client_id"],
+        client_secret=oauth2_data["client_secret"],
+        scopes=DEFAULT_SCOPES if scopes is None else tuple(scopes),
+    )
+
+
+def load_oauth2_config() -> OAuth2Config | None:
+    """Load OAuth2 configuration from file."""
     config_path = get_oauth2_config_path()
 
     if not config_path.exists():
@@ -214,14 +360,9 @@ def load_oauth2_config() -> OAuth2Config | None:
         return None
 
     try:
-        with open(config_path) as f:
-            config_data = yaml.safe_load(f)
-
-        oauth2_data = config_data.get("google_oauth2", {})
-        return OAuth2Config(
-            client_id=oauth2_data["client_id"],
-            client_secret=oauth2_data["client_secret"],
-            scopes=oauth2_data.get("scopes", None),
+        stat = config_path.stat()
+        return _load_oauth2_config_file(
+            str(config_path), stat.st_mtime_ns, stat.st_size
         )
     except Exception as e:
         print(f"❌ Error loading OAuth2 configuration: {e}")
@@ -2,67 +2,140 @@
 """Command-line interface for Calsinki calendar synchronization service."""
 
 import argparse
+import functools
+import io
 import sys
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any, TextIO, TypedDict
 
 from calsinki import __version__
-from calsinki.auth import (
-    GoogleAuthenticator,
-    create_oauth2_config_file,
-    load_oauth2_config,
-)
-from calsinki.config import (
-    Config,
-    create_example_config,
-    ensure_directories,
-    get_config_dir,
-    get_credentials_dir,
-    get_default_config_path,
-)
-from calsinki.purge import handle_purge_all_command, handle_purge_rules_command
-from calsinki.sync import CalendarSynchronizer
 
+# Command modules are imported inside the handlers that need them so that
+# `--version`, `--help` and argument errors don't pay for loading YAML,
+# google-auth and the Google API client.
 
-def main():
-    """Main CLI entry point."""
-    parser = argparse.ArgumentParser(
-        description="Calsinki - Self-hosted calendar synchronization service",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+
+def _get_config_path(args: argparse.Namespace) -> Path:
+    """Resolve the --config option, falling back to the default location."""
+    config_path: Path | None = args.config
+    if config_path is not None:
+        return config_path
+
+    from calsinki.config import get_default_config_path
+
+    return get_default_config_path()
+
+
+# Usage examples shown at the end of --help
+_EPILOG = """
 Examples:
   calsinki init                    # Initialize configuration structure
   calsinki auth --setup            # Set up OAuth2 configuration
   calsinki auth                    # Authenticate all accounts
   calsinki auth personal           # Authenticate specific account
   calsinki auth xteam personal     # Authenticate multiple specific accounts
+  calsinki auth --parallel 4       # Refresh up to 4 accounts concurrently
   calsinki sync                    # Run calendar synchronization
   calsinki sync --dry-run          # Preview sync without making changes
   calsinki sync demo_to_personal   # Sync specific sync rule
   calsinki sync --list             # List available sync rules
+  calsinki sync --jobs 4           # Run up to 4 sync rules concurrently
   calsinki purge demo_to_personal  # Remove events from specific sync rule
   calsinki purge --all             # Remove all synced events from all rules
   calsinki purge --dry-run         # Show what would be purged
   calsinki config                  # Show current configuration
   calsinki config --example        # Show example configuration
+  calsinki config --validate       # Show configuration and check sync rules
   calsinki --version               # Show version information
-        """,
-    )
-
-    parser.add_argument(
-        "--version", action="version", version=f"Calsinki {__version__}"
-    )
-
-    parser.add_argument(
-        "--config",
-        type=Path,
-        default=get_default_config_path(),
-        help=f"Path to configuration file (default: {get_default_config_path()})",
-    )
-
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-
-    # Sync command
-    sync_parser = subparsers.add_parser("sync", help="Synchronize calendars")
+"""
+
+# Rule printed under section headings; the same as calsinki.auth._QR_BANNER
+# (tests/test_cli.py checks they match)
+_BANNER = "=" * 50
+
+# Target status labels used by the config and sync --list displays
+_ENABLED = "✅ enabled"
+_DISABLED = "❌ disabled"
+
+# The Calendar API accepts at most this many calls in one batch request
+_MAX_BATCH_SIZE = 50
+
+# Concurrent token refreshes share a connection pool of this size
+# (calsinki.auth.REFRESH_POOL_SIZE, repeated here so parsing arguments doesn't
+# import the auth module; tests/test_cli.py checks they match); more workers
+# would just queue for it
+_MAX_AUTH_PARALLEL = 8
+
+
+class _SubcommandKwargs(TypedDict, total=False):
+    """Keyword arguments for a subcommand's add_parser() stub."""
+
+    help: str
+    description: str
+
+
+# Subcommands and the keyword arguments for their add_parser() stubs
+_SUBCOMMANDS: dict[str, _SubcommandKwargs] = {
+    "sync": {"help": "Synchronize calendars"},
+    "purge": {
+        "help": "Purge synced events from calendars",
+        "description": "Remove all events created by Calsinki synchronization. Use --all to purge all events, or specify sync rule IDs for targeted purging.",
+    },
+    "auth": {"help": "Authenticate with Google accounts"},
+    "config": {"help": "Show current configuration"},
+    "init": {
+        "help": "Initialize Calsinki configuration structure and create starter config"
+    },
+}
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """Find the subcommand in argv without running the full parser.
+
+    Returns None for help requests and anything unrecognised, in which case
+    the complete parser is built so help and error messages stay accurate.
+    """
+    args = iter(argv)
+    for arg in args:
+        if arg in ("-h", "--help"):
+            return None
+        if len(arg) > 2 and "--config".startswith(arg):
+            next(args, None)  # Skip the option's value
+        elif not arg.startswith("-"):
+            return arg if arg in _SUBCOMMANDS else None
+    return None
+
+
+def _batch_size(value: str) -> int:
+    """argparse type for --batch-size."""
+    size = int(value)
+    if not 1 <= size <= _MAX_BATCH_SIZE:
+        raise argparse.ArgumentTypeError(
+            f"must be between 1 and {_MAX_BATCH_SIZE}, got {size}"
+        )
+    return size
+
+
+def _auth_parallel(value: str) -> int:
+    """argparse type for auth --parallel."""
+    count = int(value)
+    if not 1 <= count <= _MAX_AUTH_PARALLEL:
+        raise argparse.ArgumentTypeError(
+            f"must be between 1 and {_MAX_AUTH_PARALLEL}, got {count}"
+        )
+    return count
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for options that take a count of at least 1."""
+    count = int(value)
+    if count < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {count}")
+    return count
+
+
+def _add_sync_arguments(sync_parser: argparse.ArgumentParser) -> None:
     sync_parser.add_argument(
         "rules",
         nargs="*",
@@ -78,13 +151,25 @@ Examples:
         action="store_true",
         help="Show what would be synced without actually modifying calendars",
     )
-
-    # Purge command
-    purge_parser = subparsers.add_parser(
-        "purge",
-        help="Purge synced events from calendars",
-        description="Remove all events created by Calsinki synchronization. Use --all to purge all events, or specify sync rule IDs for targeted purging.",
+    sync_parser.add_argument(
+        "--batch-size",
+        type=_batch_size,
+        default=_MAX_BATCH_SIZE,
+        help=f"Event changes sent per Calendar API batch request, 1 to disable batching (default: {_MAX_BATCH_SIZE})",
+    )
+    sync_parser.add_argument(
+        "-j",
+        "--jobs",
+        "--parallel-rules",
+        dest="parallel_rules",
+        type=_positive_int,
+        default=1,
+        metavar="N",
+        help="Number of sync rules to run concurrently (default: 1)",
     )
+
+
+def _add_purge_arguments(purge_parser: argparse.ArgumentParser) -> None:
     purge_parser.add_argument(
         "--all",
         action="store_true",
@@ -101,10 +186,8 @@ Examples:
         help="Show what would be purged without actually deleting events",
     )
 
-    # Auth command
-    auth_parser = subparsers.add_parser(
-        "auth", help="Authenticate with Google accounts"
-    )
+
+def _add_auth_arguments(auth_parser: argparse.ArgumentParser) -> None:
     auth_parser.add_argument(
         "--setup",
         action="store_true",
@@ -115,86 +198,240 @@ Examples:
         nargs="*",
         help="Specific account names to authenticate (default: all accounts)",
     )
+    auth_parser.add_argument(
+        "--parallel",
+        type=_auth_parallel,
+        default=1,
+        metavar="N",
+        help=f"Number of accounts to load and refresh concurrently, up to {_MAX_AUTH_PARALLEL}; accounts needing sign-in are still handled one at a time (default: 1)",
+    )
+
 
-    # Config command
-    config_parser = subparsers.add_parser("config", help="Show current configuration")
+def _add_config_arguments(config_parser: argparse.ArgumentParser) -> None:
     config_parser.add_argument(
         "--example",
         action="store_true",
         help="Show example configuration instead of current config",
     )
-
-    # Init command
-    init_parser = subparsers.add_parser(
-        "init",
-        help="Initialize Calsinki configuration structure and create starter config",
+    config_parser.add_argument(
+        "--validate",
+        action="store_true",
+        help="Also check that sync rules reference existing calendars",
     )
+
+
+def _add_init_arguments(init_parser: argparse.ArgumentParser) -> None:
     init_parser.add_argument(
         "--force", action="store_true", help="Overwrite existing configuration files"
     )
 
-    args = parser.parse_args()
 
-    if not args.command:
-        parser.print_help()
-        return 1
+_ARGUMENT_BUILDERS = {
+    "sync": _add_sync_arguments,
+    "purge": _add_purge_arguments,
+    "auth": _add_auth_arguments,
+    "config": _add_config_arguments,
+    "init": _add_init_arguments,
+}
+
+
+# Boolean flags of each subcommand, and the name of its positional list, as
+# understood by _fast_parse_args()
+_FAST_FLAGS = {
+    "sync": {"--list": "list", "--dry-run": "dry_run"},
+    "purge": {"--all": "all", "--dry-run": "dry_run"},
+    "auth": {"--setup": "setup"},
+    "config": {"--example": "example", "--validate": "validate"},
+    "init": {"--force": "force"},
+}
+_FAST_POSITIONALS = {"sync": "rules", "purge": "rules", "auth": "accounts"}
+_FAST_DEFAULTS = {
+    "sync": {"batch_size": _MAX_BATCH_SIZE, "parallel_rules": 1},
+    "auth": {"parallel": 1},
+}
+
+
+def _fast_parse_args(argv: list[str]) -> argparse.Namespace | None:
+    """Parse plain command lines without building an argparse parser.
+
+    Produces the same namespace argparse would. Returns None for anything
+    beyond exact flags and positionals, such as help, abbreviations or
+    errors, so that argparse can handle it with its usual messages.
+    """
+    config = None
+    no_config_cache = False
+    i = 0
+    while i < len(argv) and argv[i].startswith(("--config", "--no-config-cache")):
+        if argv[i] == "--no-config-cache":
+            no_config_cache = True
+            i += 1
+        elif (
+            argv[i] == "--config"
+            and i + 1 < len(argv)
+            and not argv[i + 1].startswith("-")
+        ):
+            config = Path(argv[i + 1])
+            i += 2
+        elif argv[i].startswith("--config="):
+            config = Path(argv[i][len("--config=") :])
+            i += 1
+        else:
+            return None
+
+    if i >= len(argv) or argv[i] not in _FAST_FLAGS:
+        return None
+    command = argv[i]
+    flags = _FAST_FLAGS[command]
+    positional = _FAST_POSITIONALS.get(command)
+
+    values: dict[str, Any] = {
+        "config": config,
+        "no_config_cache": no_config_cache,
+        "command": command,
+    }
+    values.update(dict.fromkeys(flags.values(), False))
+    values.update(_FAST_DEFAULTS.get(command, {}))
+    if positional:
+        values[positional] = []
+
+    # argparse only accepts a single run of positionals for nargs="*"
+    seen_positional = seen_flag_after = False
+    for arg in argv[i + 1 :]:
+        if arg in flags:
+            values[flags[arg]] = True
+            seen_flag_after = seen_positional
+        elif positional and not arg.startswith("-") and not seen_flag_after:
+            values[positional].append(arg)
+            seen_positional = True
+        else:
+            return None
+
+    return argparse.Namespace(**values)
+
+
+@functools.cache
+def _build_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """Build the argument parser; reused across repeated main() calls.
+
+    Every subcommand is registered, but only the given command's arguments
+    are added. With no command, all of them are, for complete help output;
+    only that parser renders top-level help, so only it carries the epilog.
+    """
+    parser = argparse.ArgumentParser(
+        description="Calsinki - Self-hosted calendar synchronization service",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG if command is None else None,
+    )
+
+    parser.add_argument(
+        "--version", action="version", version=f"Calsinki {__version__}"
+    )
+
+    parser.add_argument(
+        "--config",
+        type=Path,
+        default=None,
+        help="Path to configuration file (default: config.yaml in the Calsinki config directory)",
+    )
+
+    parser.add_argument(
+        "--no-config-cache",
+        action="store_true",
+        help="Always parse the configuration file instead of reusing the cached copy",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    for name, parser_kwargs in _SUBCOMMANDS.items():
+        subparser = subparsers.add_parser(name, **parser_kwargs)
+        if command is None or command == name:
+            _ARGUMENT_BUILDERS[name](subparser)
+
+    return parser
+
+
+def main():
+    """Main CLI entry point."""
+    argv = sys.argv[1:]
+
+    # Same output as argparse's version action, without building the parser
+    if argv == ["--version"]:
+        print(f"Calsinki {__version__}")
+        return 0
+
+    # Common invocations skip argparse; it stays authoritative for the rest
+    args = _fast_parse_args(argv)
+    if args is None:
+        parser = _build_parser(_sniff_subcommand(argv))
+        args = parser.parse_args(argv)
+
+        if not args.command:
+            parser.print_help()
+            return 1
 
     # Handle commands
-    if args.command == "sync":
-        return handle_sync_command(args)
-    elif args.command == "auth":
-        return handle_auth_command(args)
-    elif args.command == "config":
-        return handle_config_command(args)
-    elif args.command == "init":
-        return handle_init_command(args)
-    elif args.command == "purge":
-        return handle_purge_command(args)
+    handler = _COMMAND_HANDLERS.get(args.command)
+    if handler is not None:
+        return handler(args)
 
     return 0
 
 
 def handle_config_command(args) -> int:
     """Handle the config command."""
+    from calsinki.config import Config, create_example_config
+
+    # Output is collected and written in one go rather than line by line
+    out: list[str] = []
+
+    # Checked before anything is loaded, so the template dump never reads
+    # the config file or imports PyYAML
     if args.example:
-        print("📋 Example Configuration:")
-        print("=" * 50)
-        print(create_example_config())
+        out.append("📋 Example Configuration:")
+        out.append(_BANNER)
+        out.append(create_example_config())
+        sys.stdout.write("\n".join(out) + "\n")
         return 0
 
     # Try to load and display current configuration
+    config_path = _get_config_path(args)
     try:
-        config = Config.from_file(args.config)
-        print("⚙️ Current Configuration:")
-        print("=" * 50)
-
-        print(f"📊 Accounts ({len(config.accounts)}):")
-        for account in config.accounts:
-            print(f"  • {account.name} ({account.email}) - {account.auth_type}")
+        config = Config.from_file(config_path, disk_cache=not args.no_config_cache)
+        accounts = config.accounts
+        sync_rules = config.sync_rules
+        get_calendar_by_label = config.get_calendar_by_label
+        append = out.append
+
+        append("⚙️ Current Configuration:")
+        append(_BANNER)
+
+        append(f"📊 Accounts ({len(accounts)}):")
+        for account in accounts:
+            append(f"  • {account.name} ({account.email}) - {account.auth_type}")
             if account.calendars:
                 for calendar in account.calendars:
                     desc = f" - {calendar.description}" if calendar.description else ""
-                    print(f"    └─ {calendar.name} ({calendar.calendar_id}){desc}")
+                    append(f"    └─ {calendar.name} ({calendar.calendar_id}){desc}")
             else:
-                print("    └─ No calendars configured")
+                append("    └─ No calendars configured")
 
         # Display sync rules if any exist
-        if config.sync_rules:
-            print(f"\n📋 Sync Rules ({len(config.sync_rules)}):")
-            for rule in config.sync_rules:
-                source_cal = config.get_calendar_by_label(rule.source_calendar)
+        if sync_rules:
+            append(f"\n📋 Sync Rules ({len(sync_rules)}):")
+            for rule in sync_rules:
+                source_cal = get_calendar_by_label(rule.source_calendar)
                 source_name = source_cal.name if source_cal else rule.source_calendar
 
-                print(
+                append(
                     f"  • [{rule.id}] {source_name} → {len(rule.destination)} destination(s)"
                 )
 
                 for i, target in enumerate(rule.destination):
-                    dest_cal = config.get_calendar_by_label(target.calendar)
+                    dest_cal = get_calendar_by_label(target.calendar)
                     dest_name = dest_cal.name if dest_cal else target.calendar
-                    status = "✅ enabled" if target.enabled else "❌ disabled"
+                    status = _ENABLED if target.enabled else _DISABLED
 
-                    print(f"    {i+1}. {dest_name} ({target.privacy_mode}) - {status}")
+                    append(f"    {i+1}. {dest_name} ({target.privacy_mode}) - {status}")
 
                     # Show title customization if configured
                     title_custom = []
@@ -203,32 +440,37 @@ def handle_config_command(args) -> int:
                     if target.title_suffix:
                         title_custom.append(f"suffix: '{target.title_suffix}'")
                     if title_custom:
-                        print(f"       └─ Title: {', '.join(title_custom)}")
+                        append(f"       └─ Title: {', '.join(title_custom)}")
 
                     # Show event color if configured
                     if target.event_color:
-                        print(f"       └─ Color: {target.event_color}")
+                        append(f"       └─ Color: {target.event_color}")
 
-                    print(f"       └─ {target.calendar}")
+                    append(f"       └─ {target.calendar}")
 
-        print(f"\n📁 Data Directory: {config.data_dir}")
-        print(f"📝 Log Level: {config.log_level}")
+        append(f"\n📁 Data Directory: {config.data_dir}")
+        append(f"📝 Log Level: {config.log_level}")
         if config.log_file:
-            print(f"📄 Log File: {config.log_file}")
+            append(f"📄 Log File: {config.log_file}")
 
-        # Validate configuration
-        errors = config.validate()
+        # Validate configuration; sync rules are only checked on request
+        errors = config.validate() if args.validate else config.validate_quick()
         if errors:
-            print(f"\n⚠️  Configuration Issues ({len(errors)}):")
+            append(f"\n⚠️  Configuration Issues ({len(errors)}):")
             for error in errors:
-                print(f"  • {error}")
+                append(f"  • {error}")
+        elif args.validate:
+            append("\n✅ Configuration is valid!")
         else:
-            print("\n✅ Configuration is valid!")
+            append(
+                "\n✅ Accounts and calendars look valid (use --validate to also check sync rules)"
+            )
 
+        sys.stdout.write("\n".join(out) + "\n")
         return 0
 
     except FileNotFoundError:
-        print(f"❌ Configuration file not found: {args.config}")
+        print(f"❌ Configuration file not found: {config_path}")
         print("\n💡 Use 'calsinki init' to create a new configuration")
         return 1
     except Exception as e:
@@ -236,40 +478,99 @@ def handle_config_command(args) -> int:
         return 1
 
 
+class _ThreadBufferedStdout:
+    """Stand-in for sys.stdout that buffers the output of capturing threads.
+
+    Lets concurrently running sync rules print freely while their output is
+    replayed in order, each under its own rule's header. Threads that haven't
+    called capture() write straight through.
+    """
+
+    def __init__(self, stream: TextIO):
+        import threading
+
+        self._stream = stream
+        self._local = threading.local()
+
+    def capture(self) -> None:
+        """Start buffering the calling thread's output."""
+        self._local.buffer = io.StringIO()
+
+    def release(self) -> str:
+        """Stop buffering the calling thread's output and return it."""
+        buffer: io.StringIO = self._local.buffer
+        del self._local.buffer
+        return buffer.getvalue()
+
+    def write(self, text: str) -> int:
+        buffer: io.StringIO | None = getattr(self._local, "buffer", None)
+        if buffer is None:
+            return self._stream.write(text)
+        return buffer.write(text)
+
+    def flush(self) -> None:
+        self._stream.flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
+
+
+def _run_buffered(
+    stdout: _ThreadBufferedStdout, func: Callable[..., Any], *args: Any, **kwargs: Any
+) -> tuple[Any, str, Exception | None]:
+    """Call func with this thread's output buffered.
+
+    Returns the result, the buffered output and the exception func raised, if
+    any, so the caller can replay the output before re-raising.
+    """
+    stdout.capture()
+    result = error = None
+    try:
+        result = func(*args, **kwargs)
+    except Exception as e:
+        error = e
+    finally:
+        output = stdout.release()
+    return result, output, error
+
+
 def handle_sync_command(args) -> int:
     """Handle the sync command."""
+    from calsinki.config import Config
+
+    config_path = _get_config_path(args)
     try:
-        config = Config.from_file(args.config)
+        config = Config.from_file(config_path, disk_cache=not args.no_config_cache)
 
         if args.list:
-            print("🔄 Available Sync Rules:")
-            print("=" * 50)
+            out: list[str] = ["🔄 Available Sync Rules:", _BANNER]
 
             # Show sync rules
             if config.sync_rules:
                 for rule in config.sync_rules:
                     source_cal = config.get_calendar_by_label(rule.source_calendar)
-                    enabled_targets = [t for t in rule.destination if t.enabled]
+                    enabled_targets = rule.enabled_destinations
                     total_targets = len(rule.destination)
 
                     if source_cal:
-                        print(
+                        out.append(
                             f"  [{rule.id}] {source_cal.name} → {len(enabled_targets)}/{total_targets} destination(s)"
                         )
                         for i, target in enumerate(rule.destination):
                             dest_cal = config.get_calendar_by_label(target.calendar)
                             dest_name = dest_cal.name if dest_cal else target.calendar
-                            status = "✅ enabled" if target.enabled else "❌ disabled"
-                            print(
+                            status = _ENABLED if target.enabled else _DISABLED
+                            out.append(
                                 f"    {i+1}. {dest_name} ({target.privacy_mode}) - {status}"
                             )
                     else:
-                        print(
+                        out.append(
                             f"  [{rule.id}] {rule.source_calendar} → {len(enabled_targets)}/{total_targets} destination(s)"
                         )
             else:
-                print("  No sync rules configured")
+                out.append("  No sync rules configured")
 
+            sys.stdout.write("\n".join(out) + "\n")
             return 0
 
         # Determine which sync operations to perform
@@ -278,10 +579,9 @@ def handle_sync_command(args) -> int:
             rules_to_sync = []
 
             for rule_id in args.rules:
-                rule = next((r for r in config.sync_rules if r.id == rule_id), None)
+                rule = config.get_sync_rule(rule_id)
                 if rule:
-                    enabled_targets = [t for t in rule.destination if t.enabled]
-                    if enabled_targets:
+                    if rule.enabled_destinations:
                         rules_to_sync.append(rule)
                     else:
                         print(
@@ -300,7 +600,7 @@ def handle_sync_command(args) -> int:
             )
         else:
             # Sync all enabled rules
-            rules_to_sync = config.get_enabled_sync_rules()
+            rules_to_sync = list(config.get_enabled_sync_rules())
 
             if not rules_to_sync:
                 print("❌ No enabled sync rules found")
@@ -316,37 +616,88 @@ def handle_sync_command(args) -> int:
             print("🚀 Starting calendar synchronization...")
 
         # Initialize the synchronizer
-        synchronizer = CalendarSynchronizer(config)
+        from calsinki.sync import CalendarSynchronizer
 
-        # Sync each rule
-        for rule in rules_to_sync:
-            source_cal = config.get_calendar_by_label(rule.source_calendar)
-            enabled_targets = [t for t in rule.destination if t.enabled]
+        synchronizer = CalendarSynchronizer(config, batch_size=args.batch_size)
 
-            if source_cal and enabled_targets:
-                if args.dry_run:
-                    print(
-                        f"\n🔍 DRY RUN: Would sync rule [{rule.id}] {source_cal.name} → {len(enabled_targets)} destination(s)"
-                    )
-                else:
-                    print(
-                        f"\n🔄 Syncing rule [{rule.id}] {source_cal.name} → {len(enabled_targets)} destination(s)"
-                    )
-
-                # Perform the sync (with dry-run support)
-                success = synchronizer.sync_rule(rule, dry_run=args.dry_run)
+        # Resolve each rule's source calendar and enabled targets once
+        prepared = [
+            (
+                rule,
+                config.get_calendar_by_label(rule.source_calendar),
+                rule.enabled_destinations,
+            )
+            for rule in rules_to_sync
+        ]
+
+        # With --parallel-rules the rules are all started up front; rules that
+        # share a destination calendar may write to it at the same time. Each
+        # worker's output is buffered and printed below under its rule's
+        # header, in order.
+        futures = {}
+        completed = False
+        executor = None
+        stdout = sys.stdout
+        if args.parallel_rules > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            buffered_stdout = _ThreadBufferedStdout(stdout)
+            sys.stdout = buffered_stdout
+            executor = ThreadPoolExecutor(max_workers=args.parallel_rules)
+            futures = {
+                index: executor.submit(
+                    _run_buffered,
+                    buffered_stdout,
+                    synchronizer.sync_rule,
+                    rule,
+                    dry_run=args.dry_run,
+                    source_calendar=source_cal,
+                )
+                for index, (rule, source_cal, enabled_targets) in enumerate(prepared)
+                if source_cal and enabled_targets
+            }
 
-                if success:
+        # Sync each rule
+        try:
+            for index, (rule, source_cal, enabled_targets) in enumerate(prepared):
+                if source_cal and enabled_targets:
                     if args.dry_run:
-                        print("  🔍 DRY RUN: Sync preview completed successfully")
+                        print(
+                            f"\n🔍 DRY RUN: Would sync rule [{rule.id}] {source_cal.name} → {len(enabled_targets)} destination(s)"
+                        )
+                    else:
+                        print(
+                            f"\n🔄 Syncing rule [{rule.id}] {source_cal.name} → {len(enabled_targets)} destination(s)"
+                        )
+
+                    # Perform the sync (with dry-run support)
+                    if index in futures:
+                        success, output, error = futures[index].result()
+                        sys.stdout.write(output)
+                        if error is not None:
+                            raise error
+                    else:
+                        success = synchronizer.sync_rule(
+                            rule, dry_run=args.dry_run, source_calendar=source_cal
+                        )
+
+                    if success:
+                        if args.dry_run:
+                            print("  🔍 DRY RUN: Sync preview completed successfully")
+                        else:
+                            print("  ✅ Sync completed successfully")
                     else:
-                        print("  ✅ Sync completed successfully")
+                        print("  ❌ Sync failed")
                 else:
-                    print("  ❌ Sync failed")
-            else:
-                print(
-                    f"  ❌ [{rule.id}] Calendar details not found or no enabled destinations"
-                )
+                    print(
+                        f"  ❌ [{rule.id}] Calendar details not found or no enabled destinations"
+                    )
+            completed = True
+        finally:
+            if executor is not None:
+                # After an error or Ctrl-C, don't start the rules still queued
+                executor.shutdown(cancel_futures=not completed)
+            sys.stdout = stdout
 
         if args.dry_run:
             print("\n🔍 DRY RUN COMPLETE - No changes were made to calendars")
@@ -355,7 +706,7 @@ def handle_sync_command(args) -> int:
         return 0
 
     except FileNotFoundError:
-        print(f"❌ Configuration file not found: {args.config}")
+        print(f"❌ Configuration file not found: {config_path}")
         return 1
     except Exception as e:
         print(f"❌ Error during sync: {e}")
@@ -364,19 +715,29 @@ def handle_sync_command(args) -> int:
 
 def handle_auth_command(args) -> int:
     """Handle the auth command."""
+    from calsinki.auth import (
+        GoogleAuthenticator,
+        create_oauth2_config_file,
+        load_oauth2_config,
+    )
+    from calsinki.config import Config
+
     try:
         if args.setup:
             # Create OAuth2 config file
             print("🔧 Setting up OAuth2 configuration...")
             oauth2_config_path = create_oauth2_config_file()
-            print(f"✅ OAuth2 config file created at: {oauth2_config_path}")
-            print("\n💡 Next steps:")
-            print("   1. Go to Google Cloud Console: https://console.cloud.google.com/")
-            print("   2. Create a new project or select existing one")
-            print("   3. Enable Google Calendar API")
-            print("   4. Create OAuth 2.0 credentials")
-            print("   5. Edit the config file with your client_id and client_secret")
-            print("   6. Run 'calsinki auth' to authenticate")
+            out = [
+                f"✅ OAuth2 config file created at: {oauth2_config_path}",
+                "\n💡 Next steps:",
+                "   1. Go to Google Cloud Console: https://console.cloud.google.com/",
+                "   2. Create a new project or select existing one",
+                "   3. Enable Google Calendar API",
+                "   4. Create OAuth 2.0 credentials",
+                "   5. Edit the config file with your client_id and client_secret",
+                "   6. Run 'calsinki auth' to authenticate",
+            ]
+            sys.stdout.write("\n".join(out) + "\n")
             return 0
 
         # Load OAuth2 configuration
@@ -387,16 +748,16 @@ def handle_auth_command(args) -> int:
             return 1
 
         # Load main configuration to get accounts
-        config = Config.from_file(args.config)
+        config = Config.from_file(
+            _get_config_path(args), disk_cache=not args.no_config_cache
+        )
 
         # Determine which accounts to authenticate
         if args.accounts:
             # Authenticate specific accounts
             accounts_to_auth = []
             for account_name in args.accounts:
-                account = next(
-                    (acc for acc in config.accounts if acc.name == account_name), None
-                )
+                account = config.get_account(account_name)
                 if account:
                     if account.auth_type == "oauth2":
                         accounts_to_auth.append(account)
@@ -426,12 +787,54 @@ def handle_auth_command(args) -> int:
 
             print(f"🔐 Authenticating all {len(accounts_to_auth)} OAuth2 account(s)")
 
+        # Accounts with saved credentials only need a token refresh at most, so
+        # those run concurrently; the rest need sign-in and are done one by one
+        saved_credentials_tried = False
+        if args.parallel > 1 and len(accounts_to_auth) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=args.parallel) as executor:
+                futures = [
+                    (
+                        account,
+                        executor.submit(
+                            GoogleAuthenticator(
+                                account.name, oauth2_config
+                            ).authenticate,
+                            interactive=False,
+                        ),
+                    )
+                    for account in accounts_to_auth
+                ]
+
+            needs_sign_in = []
+            for account, future in futures:
+                try:
+                    credentials = future.result()
+                except Exception as e:
+                    print(f"❌ Failed to authenticate {account.name}: {e}")
+                    return 1
+
+                if credentials is None:
+                    needs_sign_in.append(account)
+                else:
+                    print(
+                        f"\n🔐 Authenticating account: {account.name} ({account.email})"
+                    )
+                    print(f"✅ Successfully authenticated {account.name}")
+
+            accounts_to_auth = needs_sign_in
+            saved_credentials_tried = True
+
         # Authenticate selected accounts
         for account in accounts_to_auth:
             print(f"\n🔐 Authenticating account: {account.name} ({account.email})")
             try:
-                authenticator = GoogleAuthenticator(account.name, oauth2_config)
-                authenticator.authenticate()
+                # Loading and refreshing saved credentials may already have
+                # failed above, in which case go straight to sign-in
+                GoogleAuthenticator(account.name, oauth2_config).authenticate(
+                    skip_saved=saved_credentials_tried
+                )
                 print(f"✅ Successfully authenticated {account.name}")
             except Exception as e:
                 print(f"❌ Failed to authenticate {account.name}: {e}")
@@ -448,20 +851,28 @@ def handle_auth_command(args) -> int:
 
 def handle_purge_command(args) -> int:
     """Handle the purge command."""
+    from calsinki.auth import load_oauth2_config
+    from calsinki.config import Config
+
     try:
         print("🗑️  Starting event purge operation...")
 
         # Safety check: require explicit --all or specific sync rule IDs
         if not args.all and not args.rules:
-            print("❌ SAFETY ERROR: No purge target specified!")
-            print("💡 You must either:")
-            print("   • Use --all to purge ALL events from ALL calendars")
-            print("   • Specify sync rule IDs: calsinki purge sync_rule_1 sync_rule_2")
-            print("💡 This prevents accidental deletion of all synced events.")
+            out = [
+                "❌ SAFETY ERROR: No purge target specified!",
+                "💡 You must either:",
+                "   • Use --all to purge ALL events from ALL calendars",
+                "   • Specify sync rule IDs: calsinki purge sync_rule_1 sync_rule_2",
+                "💡 This prevents accidental deletion of all synced events.",
+            ]
+            sys.stdout.write("\n".join(out) + "\n")
             return 1
 
         # Load configuration
-        config = Config.from_file(args.config)
+        config = Config.from_file(
+            _get_config_path(args), disk_cache=not args.no_config_cache
+        )
 
         # Load OAuth2 configuration
         oauth2_config = load_oauth2_config()
@@ -471,6 +882,12 @@ def handle_purge_command(args) -> int:
             return 1
 
         # Initialize synchronizer for API access
+        from calsinki.purge import (
+            handle_purge_all_command,
+            handle_purge_rules_command,
+        )
+        from calsinki.sync import CalendarSynchronizer
+
         synchronizer = CalendarSynchronizer(config)
 
         if args.all:
@@ -487,6 +904,14 @@ def handle_purge_command(args) -> int:
 
 def handle_init_command(args) -> int:
     """Handle the init command."""
+    from calsinki.config import (
+        create_example_config,
+        ensure_directories,
+        get_config_dir,
+        get_credentials_dir,
+        get_default_config_path,
+    )
+
     try:
         print("🚀 Initializing Calsinki configuration structure...")
 
@@ -503,16 +928,18 @@ def handle_init_command(args) -> int:
             return 1
 
         # Write configuration file
-        with open(config_path, "w", encoding="utf-8") as f:
-            f.write(example_config)
-
-        print(f"✅ Configuration initialized at: {config_path}")
-        print(f"📁 Credentials directory: {get_credentials_dir()}")
-        print(f"📁 Config directory: {get_config_dir()}")
-        print("\n💡 Next steps:")
-        print("   1. Edit the configuration file with your calendar details")
-        print("   2. Run 'calsinki auth' to authenticate with Google")
-        print("   3. Run 'calsinki sync' to start synchronization")
+        config_path.write_text(example_config, encoding="utf-8")
+
+        out = [
+            f"✅ Configuration initialized at: {config_path}",
+            f"📁 Credentials directory: {get_credentials_dir()}",
+            f"📁 Config directory: {get_config_dir()}",
+            "\n💡 Next steps:",
+            "   1. Edit the configuration file with your calendar details",
+            "   2. Run 'calsinki auth' to authenticate with Google",
+            "   3. Run 'calsinki sync' to start synchronization",
+        ]
+        sys.stdout.write("\n".join(out) + "\n")
 
         return 0
 
@@ -521,5 +948,14 @@ def handle_init_command(args) -> int:
         return 1
 
 
+_COMMAND_HANDLERS = {
+    "sync": handle_sync_command,
+    "auth": handle_auth_command,
+    "config": handle_config_command,
+    "init": handle_init_command,
+    "purge": handle_purge_command,
+}
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -1,15 +1,47 @@
 """Configuration management for Calsinki calendar synchronization service."""
 
+import functools
+import hashlib
+import json
 import os
+import sys
+import tempfile
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
-import yaml
-from platformdirs import user_config_dir, user_data_dir
+from platformdirs import user_cache_dir, user_config_dir, user_data_dir
 
 
-@dataclass
+@functools.cache
+def get_yaml_loader() -> type:
+    """Get the safe YAML loader class, importing PyYAML on first use.
+
+    Commands that never parse YAML, such as `config --example`, don't pay for
+    importing it.
+    """
+    import yaml
+
+    # Prefer the libyaml-backed loader; it is several times faster than the
+    # pure-Python parser and produces identical output. It is missing when
+    # PyYAML was built without libyaml.
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _intern(value: Any) -> Any:
+    """Intern identifier strings from the config; other YAML scalars pass through.
+
+    Labels, IDs and enum-like values (auth_type, privacy_mode) are repeated
+    across accounts and sync rules, so interning lets those references share
+    one string object and index lookups and comparisons hit the identity fast
+    path. The JSON disk cache doesn't keep that sharing, but configs loaded
+    from it go through from_dict() and are interned again.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True)
 class Calendar:
     """Configuration for a specific calendar within an account."""
 
@@ -20,14 +52,10 @@ class Calendar:
 
     def get_account_name(self, config: "Config") -> str | None:
         """Get the account name that owns this calendar."""
-        for account in config.accounts:
-            for calendar in account.calendars:
-                if calendar.calendar_id == self.calendar_id:
-                    return account.name
-        return None
+        return config.get_account_name_for_calendar(self.calendar_id)
 
 
-@dataclass
+@dataclass(slots=True)
 class CalendarAccount:
     """Configuration for a single Google Calendar account."""
 
@@ -40,7 +68,7 @@ class CalendarAccount:
     )  # List of calendars in this account
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncTarget:
     """Configuration for a single target calendar within a sync rule."""
 
@@ -60,7 +88,7 @@ class SyncTarget:
     enabled: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncRule:
     """Configuration for a source calendar sync rule with multiple target calendars."""
 
@@ -70,10 +98,20 @@ class SyncRule:
         default_factory=list
     )  # List of target calendars with individual settings
 
+    @property
+    def enabled_destinations(self) -> tuple[SyncTarget, ...]:
+        """Get the enabled target calendars for this rule."""
+        return tuple(target for target in self.destination if target.enabled)
+
 
 @dataclass
 class Config:
-    """Main configuration for Calsinki."""
+    """Main configuration for Calsinki.
+
+    Lookup indexes are built lazily on first use, so a loaded configuration
+    should be treated as read-only, or clear_indexes() called after changing
+    it.
+    """
 
     accounts: list[CalendarAccount] = field(default_factory=list)
     sync_rules: list[SyncRule] = field(default_factory=list)  # Sync rules support
@@ -83,15 +121,39 @@ class Config:
     default_identifier: str = "calsinki"  # Default identifier for all sync operations
 
     @classmethod
-    def from_file(cls, config_path: Path) -> "Config":
-        """Load configuration from YAML file."""
-        if not config_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {config_path}")
-
-        with open(config_path, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-
-        return cls.from_dict(data)
+    def from_file(cls, config_path: Path, disk_cache: bool = True) -> "Config":
+        """Load configuration from a YAML file (or JSON, for a .json path).
+
+        Parsed file contents are memoized per path, modification time and
+        size, so reloading an unchanged file within the same process skips
+        YAML parsing. Unless disk_cache is False, they are also saved as JSON
+        in the cache directory, keyed by the file's contents, so later runs
+        skip it too.
+        """
+        try:
+            stat = config_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Configuration file not found: {config_path}"
+            ) from None
+
+        return cls.from_dict(
+            _load_config_data(
+                str(config_path.resolve()),
+                stat.st_mtime_ns,
+                stat.st_size,
+                disk_cache,
+            )
+        )
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget configuration files memoized by from_file() in this process.
+
+        Cached copies in the cache directory are keyed by file contents and
+        stay valid; pass disk_cache=False to from_file() to bypass them.
+        """
+        _load_config_data.cache_clear()
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Config":
@@ -106,13 +168,15 @@ class Config:
                 if "calendars" in account_data:
                     for calendar_data in account_data["calendars"]:
                         calendar = Calendar(**calendar_data)
+                        calendar.label = _intern(calendar.label)
+                        calendar.calendar_id = _intern(calendar.calendar_id)
                         calendars.append(calendar)
 
                 # Create account with calendars
                 account = CalendarAccount(
-                    name=account_data["name"],
+                    name=_intern(account_data["name"]),
                     email=account_data["email"],
-                    auth_type=account_data.get("auth_type", "oauth2"),
+                    auth_type=_intern(account_data.get("auth_type", "oauth2")),
                     credentials_file=account_data.get("credentials_file"),
                     calendars=calendars,
                 )
@@ -126,12 +190,14 @@ class Config:
                 if "destination" in rule_data:
                     for dest_data in rule_data["destination"]:
                         destination = SyncTarget(**dest_data)
+                        destination.calendar = _intern(destination.calendar)
+                        destination.privacy_mode = _intern(destination.privacy_mode)
                         destinations.append(destination)
 
                 # Create rule with destinations
                 rule = SyncRule(
-                    id=rule_data["id"],
-                    source_calendar=rule_data["source_calendar"],
+                    id=_intern(rule_data["id"]),
+                    source_calendar=_intern(rule_data["source_calendar"]),
                     destination=destinations,
                 )
                 config.sync_rules.append(rule)
@@ -158,155 +224,218 @@ class Config:
         Examples:
         - default_identifier: "calsinki", rule.id: "demo_to_personal"
           → "calsinki_demo_to_personal"
-        """
-        default_id = getattr(self, "default_identifier", "calsinki") or "calsinki"
-        return f"{default_id}_{sync_rule.id}"
 
-    def validate(self) -> list[str]:
-        """Validate configuration and return list of errors."""
-        errors = []
+        Identifiers are memoized per rule ID, since they're looked up for
+        every synced event.
+        """
+        identifiers = self._effective_identifiers
+        identifier = identifiers.get(sync_rule.id)
+        if identifier is None:
+            identifier = f"{self.default_identifier or 'calsinki'}_{sync_rule.id}"
+            identifiers[sync_rule.id] = identifier
+        return identifier
+
+    def validate_quick(self) -> list[str]:
+        """Check required account and calendar fields and return list of errors.
+
+        Unlike validate(), this doesn't cross-reference sync rules against
+        the configured calendars.
+        """
+        errors: list[str] = []
+        append = errors.append
+        accounts = self.accounts
 
         # Validate accounts
-        for account in self.accounts:
+        for account in accounts:
             if not account.name:
-                errors.append("Account must have a name")
+                append("Account must have a name")
             if not account.email:
-                errors.append(f"Account '{account.name}' must have an email")
+                append(f"Account '{account.name}' must have an email")
 
-        # Validate calendars within accounts
-        calendar_ids = set()
-        for account in self.accounts:
+        # Validate calendars within accounts; kept as a second pass so all
+        # account errors are reported before any calendar errors
+        for account in accounts:
             for calendar in account.calendars:
                 if not calendar.calendar_id:
-                    errors.append(
+                    append(
                         f"Calendar '{calendar.name}' in account '{account.name}' must have a calendar ID"
                     )
-                else:
-                    calendar_ids.add(calendar.calendar_id)
+
+        return errors
+
+    def validate(self) -> list[str]:
+        """Validate configuration and return list of errors."""
+        errors = self.validate_quick()
+
+        # Labels resolve through the cached label index, so checking every
+        # rule and target is linear in their number
+        get_calendar_by_label = self.get_calendar_by_label
+        append = errors.append
 
         # Validate sync rules
         for rule in self.sync_rules:
+            source_label = rule.source_calendar
+
             # Check that source calendar exists
-            source_calendar = self.get_calendar_by_label(rule.source_calendar)
+            source_calendar = get_calendar_by_label(source_label)
             if not source_calendar:
-                errors.append(
-                    f"Sync rule references unknown source calendar label: {rule.source_calendar}"
+                append(
+                    f"Sync rule references unknown source calendar label: {source_label}"
                 )
 
             # Check that all destination calendars exist
             for target in rule.destination:
-                dest_calendar = self.get_calendar_by_label(target.calendar)
+                dest_calendar = get_calendar_by_label(target.calendar)
                 if not dest_calendar:
-                    errors.append(
+                    append(
                         f"Sync rule '{rule.id}' references unknown destination calendar label: {target.calendar}"
                     )
 
                 # Check that source and destination are different
-                if rule.source_calendar == target.calendar:
-                    errors.append(
-                        f"Sync rule '{rule.id}' cannot sync calendar to itself: {rule.source_calendar}"
+                if source_label == target.calendar:
+                    append(
+                        f"Sync rule '{rule.id}' cannot sync calendar to itself: {source_label}"
                     )
 
         return errors
 
+    def clear_indexes(self) -> None:
+        """Drop the lazily built lookup indexes so they reflect later changes."""
+        for name, attribute in vars(Config).items():
+            if isinstance(attribute, cached_property):
+                self.__dict__.pop(name, None)
+
+    @cached_property
+    def _effective_identifiers(self) -> dict[str, str]:
+        """Effective identifiers already computed, by sync rule ID."""
+        return {}
+
+    @cached_property
+    def _accounts_by_name(self) -> dict[str, CalendarAccount]:
+        """Index of accounts by name (first definition wins)."""
+        accounts: dict[str, CalendarAccount] = {}
+        for account in self.accounts:
+            accounts.setdefault(account.name, account)
+        return accounts
+
+    @cached_property
+    def _sync_rules_by_id(self) -> dict[str, SyncRule]:
+        """Index of sync rules by ID (first definition wins)."""
+        rules: dict[str, SyncRule] = {}
+        for rule in self.sync_rules:
+            rules.setdefault(rule.id, rule)
+        return rules
+
+    @cached_property
+    def _calendars_by_label(self) -> dict[tuple[str, str], Calendar]:
+        """Index of calendars by (account name, calendar label)."""
+        calendars: dict[tuple[str, str], Calendar] = {}
+        for account in self.accounts:
+            for calendar in account.calendars:
+                calendars.setdefault((account.name, calendar.label), calendar)
+        return calendars
+
+    @cached_property
+    def _calendars_by_id(self) -> dict[str, Calendar]:
+        """Index of calendars by calendar ID (first definition wins)."""
+        calendars: dict[str, Calendar] = {}
+        for account in self.accounts:
+            for calendar in account.calendars:
+                calendars.setdefault(calendar.calendar_id, calendar)
+        return calendars
+
+    @cached_property
+    def _calendars_by_account_and_id(self) -> dict[tuple[str, str], Calendar]:
+        """Index of calendars by (account name, calendar ID)."""
+        calendars: dict[tuple[str, str], Calendar] = {}
+        for account in self.accounts:
+            for calendar in account.calendars:
+                calendars.setdefault((account.name, calendar.calendar_id), calendar)
+        return calendars
+
+    @cached_property
+    def _calendars_by_name(self) -> dict[str, Calendar]:
+        """Index of calendars by human-readable name (first definition wins)."""
+        calendars: dict[str, Calendar] = {}
+        for account in self.accounts:
+            for calendar in account.calendars:
+                calendars.setdefault(calendar.name, calendar)
+        return calendars
+
+    @cached_property
+    def _account_names_by_calendar_id(self) -> dict[str, str]:
+        """Index of owning account names by calendar ID (first owner wins)."""
+        account_names: dict[str, str] = {}
+        for account in self.accounts:
+            for calendar in account.calendars:
+                account_names.setdefault(calendar.calendar_id, account.name)
+        return account_names
+
+    @cached_property
+    def _enabled_sync_rules(self) -> tuple[SyncRule, ...]:
+        """Sync rules that have at least one enabled destination, in order."""
+        return tuple(rule for rule in self.sync_rules if rule.enabled_destinations)
+
+    @cached_property
+    def _all_calendars(self) -> tuple[Calendar, ...]:
+        """All calendars of all accounts, in definition order."""
+        return tuple(
+            calendar for account in self.accounts for calendar in account.calendars
+        )
+
     def get_account(self, name: str) -> CalendarAccount | None:
         """Get account by name."""
-        for account in self.accounts:
-            if account.name == name:
-                return account
-        return None
+        return self._accounts_by_name.get(name)
 
     def get_calendar(self, account_name: str, calendar_id: str) -> Calendar | None:
         """Get calendar by account name and calendar ID."""
-        for account in self.accounts:
-            if account.name == account_name:
-                for calendar in account.calendars:
-                    if calendar.calendar_id == calendar_id:
-                        return calendar
-        return None
+        return self._calendars_by_account_and_id.get((account_name, calendar_id))
 
     def get_calendar_by_name(self, calendar_name: str) -> Calendar | None:
         """Get calendar by its human-readable name."""
-        for account in self.accounts:
-            for calendar in account.calendars:
-                if calendar.name == calendar_name:
-                    return calendar
-        return None
+        return self._calendars_by_name.get(calendar_name)
 
     def get_calendar_by_id(self, calendar_id: str) -> Calendar | None:
         """Get calendar by its calendar ID."""
-        for account in self.accounts:
-            for calendar in account.calendars:
-                if calendar.calendar_id == calendar_id:
-                    return calendar
-        return None
+        return self._calendars_by_id.get(calendar_id)
 
     def get_calendars_for_account(self, account_name: str) -> list[Calendar]:
         """Get all calendars for a specific account."""
-        for account in self.accounts:
-            if account.name == account_name:
-                return account.calendars
-        return []
+        account = self._accounts_by_name.get(account_name)
+        return account.calendars if account else []
 
-    def get_all_calendars(self) -> list[Calendar]:
+    def get_all_calendars(self) -> tuple[Calendar, ...]:
         """Get all calendars from all accounts."""
-        all_calendars = []
-        for account in self.accounts:
-            all_calendars.extend(account.calendars)
-        return all_calendars
+        return self._all_calendars
 
     def get_account_name_for_calendar(self, calendar_id: str) -> str | None:
         """Get the account name that owns a calendar with the given ID."""
-        for account in self.accounts:
-            for calendar in account.calendars:
-                if calendar.calendar_id == calendar_id:
-                    return account.name
-        return None
+        return self._account_names_by_calendar_id.get(calendar_id)
 
     def get_calendar_id_by_label(self, account_label: str) -> str | None:
         """Get the calendar ID for a given account.label format."""
-        if "." not in account_label:
-            return None
-
-        account_name, label = account_label.split(".", 1)
-        for account in self.accounts:
-            if account.name == account_name:
-                for calendar in account.calendars:
-                    if calendar.label == label:
-                        return calendar.calendar_id
-        return None
+        calendar = self.get_calendar_by_label(account_label)
+        return calendar.calendar_id if calendar else None
 
     def get_calendar_by_label(self, account_label: str) -> Calendar | None:
         """Get a calendar by its account.label format."""
-        if "." not in account_label:
+        account_name, separator, label = account_label.partition(".")
+        if not separator:
             return None
 
-        account_name, label = account_label.split(".", 1)
-        for account in self.accounts:
-            if account.name == account_name:
-                for calendar in account.calendars:
-                    if calendar.label == label:
-                        return calendar
-        return None
+        return self._calendars_by_label.get((account_name, label))
 
     def get_sync_rule(self, rule_id: str) -> SyncRule | None:
         """Get sync rule by ID."""
-        for rule in self.sync_rules:
-            if rule.id == rule_id:
-                return rule
-        return None
+        return self._sync_rules_by_id.get(rule_id)
 
-    def get_enabled_sync_rules(self) -> list[SyncRule]:
+    def get_enabled_sync_rules(self) -> tuple[SyncRule, ...]:
         """Get all sync rules that have at least one enabled destination."""
-        enabled_rules = []
-        for rule in self.sync_rules:
-            if any(target.enabled for target in rule.destination):
-                enabled_rules.append(rule)
-        return enabled_rules
+        return self._enabled_sync_rules
 
     def get_enabled_targets_for_rule(
         self, rule_or_id: SyncRule | str
-    ) -> list[SyncTarget]:
+    ) -> tuple[SyncTarget, ...]:
         """Get all enabled targets for a specific sync rule."""
         if isinstance(rule_or_id, str):
             # If string, treat as rule ID and look it up
@@ -316,8 +445,87 @@ class Config:
             rule = rule_or_id
 
         if rule:
-            return [target for target in rule.destination if target.enabled]
-        return []
+            return rule.enabled_destinations
+        return ()
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_data(
+    config_path: str, mtime_ns: int, size: int, disk_cache: bool
+) -> Any:
+    """Parse a configuration file; cached by path, modification time and size."""
+    raw = Path(config_path).read_bytes()
+
+    # JSON configs parse about as fast as the cache itself would load
+    if not disk_cache or _is_json_config(config_path):
+        return _parse_config_data(raw, config_path)
+
+    # Cached copies are keyed by the file's path and the hash of its contents.
+    # They hold the parsed mapping as JSON, not pickled objects, so they can't
+    # go stale against the config classes and loading one can't run code.
+    path_key = hashlib.sha256(config_path.encode("utf-8")).hexdigest()[:16]
+    content_key = hashlib.sha256(raw).hexdigest()
+    cache_path = get_cache_dir() / f"config-{path_key}-{content_key}.json"
+
+    try:
+        data = json.loads(cache_path.read_bytes())
+        if isinstance(data, dict):
+            return data
+    except (OSError, ValueError):
+        pass  # Missing or unreadable cache; parse the YAML instead
+
+    data = _parse_config_data(raw, config_path)
+
+    # Caching is best-effort; a failed write just means parsing YAML next time.
+    # Mappings JSON can't represent faithfully (dates, non-string keys) are
+    # never cached.
+    try:
+        encoded = json.dumps(data)
+        if isinstance(data, dict) and json.loads(encoded) == data:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            write_private_file(cache_path, encoded.encode("utf-8"))
+            for stale_path in cache_path.parent.glob(f"config-{path_key}-*"):
+                if stale_path != cache_path:
+                    stale_path.unlink(missing_ok=True)
+    except (OSError, TypeError, ValueError):
+        pass
+
+    return data
+
+
+def _is_json_config(config_path: str) -> bool:
+    """Check whether a configuration file is JSON rather than YAML."""
+    return config_path.lower().endswith(".json")
+
+
+def _parse_config_data(raw: bytes, config_path: str) -> Any:
+    """Parse the raw bytes of a YAML or JSON configuration file."""
+    # JSON is a subset of YAML, but the json module's C parser is faster
+    if _is_json_config(config_path):
+        return json.loads(raw)
+
+    import yaml
+
+    # The loader is handed bytes, not str; libyaml detects the encoding itself
+    # and skips the decode-to-str and re-encode round trip
+    return yaml.load(raw, Loader=get_yaml_loader())
+
+
+def write_private_file(path: Path, data: bytes) -> None:
+    """Atomically write data to a file readable only by the current user."""
+    # mkstemp creates a uniquely named file with mode 0600, so concurrent
+    # writers (say a cron sync and a manual auth) never share a temp file
+    fd, tmp_name = tempfile.mkstemp(
+        prefix=f".{path.name}.", suffix=".tmp", dir=path.parent
+    )
+    tmp_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def create_example_config() -> str:
@@ -378,6 +586,11 @@ data_dir: "./data"
 """
 
 
+# The path helpers below only depend on the environment at startup, so their
+# results are resolved once per process.
+
+
+@functools.cache
 def get_config_dir() -> Path:
     """Get the standard configuration directory."""
     xdg_config = os.environ.get("XDG_CONFIG_HOME")
@@ -386,6 +599,7 @@ def get_config_dir() -> Path:
     return Path(user_config_dir("calsinki"))
 
 
+@functools.cache
 def get_credentials_dir() -> Path:
     """Get the standard credentials directory."""
     xdg_data = os.environ.get("XDG_DATA_HOME")
@@ -394,22 +608,49 @@ def get_credentials_dir() -> Path:
     return Path(user_data_dir("calsinki")) / "credentials"
 
 
+@functools.cache
+def get_cache_dir() -> Path:
+    """Get the standard cache directory."""
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    if xdg_cache:
+        return Path(xdg_cache) / "calsinki"
+    return Path(user_cache_dir("calsinki"))
+
+
+@functools.cache
 def get_default_config_path() -> Path:
     """Get the default configuration file path."""
     return get_config_dir() / "config.yaml"
 
 
+@functools.cache
 def get_credentials_path(account_name: str) -> Path:
     """Get the credentials file path for a specific account."""
     return get_credentials_dir() / f"{account_name}.json"
 
 
+@functools.cache
 def get_oauth2_config_path() -> Path:
     """Get the OAuth2 configuration file path in the data directory."""
     return get_credentials_dir() / "oauth2_config.yaml"
 
 
+@functools.cache
 def ensure_directories():
-    """Ensure that the necessary directories exist."""
+    """Ensure that the necessary directories exist (checked once per process)."""
     get_config_dir().mkdir(parents=True, exist_ok=True)
     get_credentials_dir().mkdir(parents=True, exist_ok=True)
+
+
+def clear_path_caches() -> None:
+    """Forget memoized paths, e.g. after changing XDG_* environment variables."""
+    for cached in (
+        get_config_dir,
+        get_credentials_dir,
+        get_cache_dir,
+        get_default_config_path,
+        get_credentials_path,
+        get_oauth2_config_path,
+        ensure_directories,
+    ):
+        cached.cache_clear()
@@ -9,9 +9,7 @@ def handle_purge_all_command(
 ) -> int:
     """Handle purging all events using the default identifier."""
     try:
-        default_identifier = (
-            getattr(config, "default_identifier", "calsinki") or "calsinki"
-        )
+        default_identifier = config.default_identifier or "calsinki"
         instance_property = f"{default_identifier}_synced=true"
 
         print(f"🧹 Purging all events with '{instance_property}' from all calendars...")
@@ -88,7 +86,7 @@ def handle_purge_rules_command(
 
         rules_to_purge = []
         for rule_id in args.rules:
-            rule = next((r for r in config.sync_rules if r.id == rule_id), None)
+            rule = config.get_sync_rule(rule_id)
             if rule:
                 enabled_targets = config.get_enabled_targets_for_rule(rule)
                 if enabled_targets:
@@ -0,0 +1,142 @@
+"""Terminal QR code rendering for Calsinki device-flow authentication."""
+
+import bisect
+import ctypes
+import ctypes.util
+import functools
+
+# libqrencode constants (QRecLevel / QRencodeMode enums)
+_QR_ECLEVEL_M = 1
+_QR_MODE_8 = 2
+
+# Byte-mode data capacity of QR versions 1-40 at error correction level M
+_BYTE_CAPACITY_M = (
+    14, 26, 42, 62, 84, 106, 122, 152, 180, 213,
+    251, 287, 331, 362, 412, 450, 504, 560, 624, 666,
+    711, 779, 857, 911, 997, 1059, 1125, 1190, 1264, 1370,
+    1452, 1538, 1628, 1722, 1809, 1911, 1989, 2099, 2213, 2331,
+)  # fmt: skip
+
+# Half-block characters indexed by (top module) + (bottom module << 1), in the
+# inverted order used by qrcode's print_ascii(invert=True)
+_ASCII_CODES = ("█", "▄", "▀", "\xa0")
+
+
+class _QRcode(ctypes.Structure):
+    """Mirror of libqrencode's QRcode struct."""
+
+    _fields_ = [
+        ("version", ctypes.c_int),
+        ("width", ctypes.c_int),
+        ("data", ctypes.POINTER(ctypes.c_ubyte)),
+    ]
+
+
+@functools.cache
+def _load_libqrencode() -> ctypes.CDLL | None:
+    """Load libqrencode if it is installed on the system."""
+    library_name = ctypes.util.find_library("qrencode")
+    if not library_name:
+        return None
+
+    try:
+        lib = ctypes.CDLL(library_name)
+    except OSError:
+        return None
+
+    lib.QRcode_encodeString.argtypes = [
+        ctypes.c_char_p,
+        ctypes.c_int,
+        ctypes.c_int,
+        ctypes.c_int,
+        ctypes.c_int,
+    ]
+    lib.QRcode_encodeString.restype = ctypes.POINTER(_QRcode)
+    lib.QRcode_free.argtypes = [ctypes.POINTER(_QRcode)]
+    lib.QRcode_free.restype = None
+    return lib
+
+
+def _encode_with_libqrencode(data: str) -> list[list[bool]] | None:
+    """Encode data with libqrencode, returning None if it is unavailable."""
+    lib = _load_libqrencode()
+    if lib is None:
+        return None
+
+    qr = lib.QRcode_encodeString(data.encode("utf-8"), 0, _QR_ECLEVEL_M, _QR_MODE_8, 1)
+    if not qr:
+        return None
+
+    try:
+        width = qr.contents.width
+        raw = ctypes.string_at(qr.contents.data, width * width)
+    finally:
+        lib.QRcode_free(qr)
+
+    # The lowest bit of each module byte marks a dark module
+    return [
+        [bool(raw[row + col] & 1) for col in range(width)]
+        for row in range(0, width * width, width)
+    ]
+
+
+def _encode_with_qrcode(data: str) -> list[list[bool]]:
+    """Encode data with the pure-Python qrcode library.
+
+    The code is only shown once on a terminal, so a fixed mask pattern is
+    good enough and skips qrcode's evaluation of all eight masks. The version
+    is picked from the byte-mode capacity table instead of a fit search.
+    """
+    import qrcode
+
+    version = bisect.bisect_left(_BYTE_CAPACITY_M, len(data.encode("utf-8"))) + 1
+    fits = version <= len(_BYTE_CAPACITY_M)
+
+    qr = qrcode.QRCode(
+        version=version if fits else None,
+        error_correction=qrcode.ERROR_CORRECT_M,
+        box_size=2,
+        border=0,
+        mask_pattern=0,
+    )
+    qr.add_data(data, optimize=0)
+    qr.make(fit=not fits)
+    modules: list[list[bool]] = qr.modules
+    return modules
+
+
+def _modules_to_ascii(modules: list[list[bool]], border: int) -> str:
+    """Render a module matrix as inverted half-block ASCII art."""
+    size = len(modules)
+
+    def get_module(row: int, col: int) -> int:
+        if border and max(row, col) >= size + border:
+            return 1
+        if min(row, col) < 0 or max(row, col) >= size:
+            return 0
+        return int(modules[row][col])
+
+    lines = []
+    for row in range(-border, size + border, 2):
+        lines.append(
+            "".join(
+                _ASCII_CODES[get_module(row, col) + (get_module(row + 1, col) << 1)]
+                for col in range(-border, size + border)
+            )
+        )
+    return "\n".join(lines) + "\n"
+
+
+@functools.lru_cache(maxsize=8)
+def render_qr_ascii(data: str, border: int = 2) -> str:
+    """Render data as a QR code suitable for printing in a terminal.
+
+    Uses the libqrencode C library when it is installed and falls back to the
+    qrcode package otherwise. The output matches qrcode's
+    ``print_ascii(invert=True)``. Rendering is deterministic, so results are
+    memoized per process.
+    """
+    modules = _encode_with_libqrencode(data)
+    if modules is None:
+        modules = _encode_with_qrcode(data)
+    return _modules_to_ascii(modules, border)
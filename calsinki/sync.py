@@ -1,6 +1,8 @@
 """Calendar synchronization logic for Calsinki."""
 
 import logging
+import threading
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import Any
@@ -8,7 +10,10 @@ from typing import Any
 from googleapiclient.discovery import build
 
 from .auth import GoogleAuthenticator
-from .config import Config, SyncRule
+from .config import Calendar, Config, SyncRule
+
+# Largest number of calls the Calendar API accepts in one batch request
+DEFAULT_BATCH_SIZE = 50
 
 
 @dataclass
@@ -115,12 +120,19 @@ class CalendarEvent:
 class CalendarSynchronizer:
     """Handles synchronization between Google Calendar accounts."""
 
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, batch_size: int = DEFAULT_BATCH_SIZE):
         self.config = config
         self.logger = logging.getLogger(__name__)
 
+        # Number of event writes/deletes sent per batch request (1 disables
+        # batching)
+        self.batch_size = batch_size
+
         # Initialize Google Calendar API services for each account
         self.calendar_services: dict[str, Any] = {}
+        self._credentials: dict[str, Any] = {}
+        self._owner_thread = threading.get_ident()
+        self._thread_local = threading.local()
         self._initialize_services()
 
     def _initialize_services(self):
@@ -144,6 +156,7 @@ class CalendarSynchronizer:
                     # Build the Calendar API service
                     service = build("calendar", "v3", credentials=credentials)
                     self.calendar_services[account.name] = service
+                    self._credentials[account.name] = credentials
                     self.logger.info(
                         f"✅ Initialized Calendar API service for {account.name}"
                     )
@@ -157,11 +170,86 @@ class CalendarSynchronizer:
                     f"❌ Failed to initialize service for {account.name}: {e}"
                 )
 
-    def sync_rule(self, sync_rule: SyncRule, dry_run: bool = False) -> bool:
-        """Synchronize a single sync rule to all its enabled destinations."""
+    def _get_calendar_service(self, account_name: str) -> Any | None:
+        """Get the Calendar API service for an account in the current thread.
+
+        The underlying httplib2 connections are not thread-safe, so threads
+        other than the one that created the synchronizer build their own.
+        """
+        if threading.get_ident() == self._owner_thread:
+            return self.calendar_services.get(account_name)
+
+        services = self._thread_local.__dict__.setdefault("services", {})
+        if account_name not in services:
+            credentials = self._credentials.get(account_name)
+            services[account_name] = (
+                build("calendar", "v3", credentials=credentials)
+                if credentials
+                else None
+            )
+        return services[account_name]
+
+    def _execute_batched(
+        self,
+        service: Any,
+        requests: list[tuple[Any, Any]],
+        callback: Callable[[Any, Any, Exception | None], None],
+    ) -> None:
+        """Execute API requests, up to batch_size per HTTP round trip.
+
+        ``requests`` holds (key, request) pairs. ``callback(key, response,
+        exception)`` is called once for every request, whether it succeeded
+        or failed.
+        """
+        if self.batch_size <= 1:
+            for key, request in requests:
+                try:
+                    response = request.execute()
+                except Exception as e:
+                    callback(key, None, e)
+                else:
+                    callback(key, response, None)
+            return
+
+        for start in range(0, len(requests), self.batch_size):
+            chunk = requests[start : start + self.batch_size]
+            pending = {str(n): key for n, (key, _) in enumerate(chunk)}
+
+            def on_response(
+                request_id: str,
+                response: Any,
+                exception: Exception | None,
+                pending: dict[str, Any] = pending,
+            ) -> None:
+                callback(pending.pop(request_id), response, exception)
+
+            batch = service.new_batch_http_request(callback=on_response)
+            for n, (_, request) in enumerate(chunk):
+                batch.add(request, request_id=str(n))
+
+            try:
+                batch.execute()
+            except Exception as e:
+                # The batch as a whole failed; report every unanswered request
+                for key in list(pending.values()):
+                    callback(key, None, e)
+
+    def sync_rule(
+        self,
+        sync_rule: SyncRule,
+        dry_run: bool = False,
+        source_calendar: Calendar | None = None,
+    ) -> bool:
+        """Synchronize a single sync rule to all its enabled destinations.
+
+        Callers that have already resolved the rule's source calendar can pass
+        it as source_calendar to skip the lookup.
+        """
         try:
             # Get source calendar
-            source_cal = self.config.get_calendar_by_label(sync_rule.source_calendar)
+            source_cal = source_calendar or self.config.get_calendar_by_label(
+                sync_rule.source_calendar
+            )
 
             if not source_cal:
                 self.logger.error(
@@ -179,7 +267,7 @@ class CalendarSynchronizer:
                 )
                 return False
 
-            source_service = self.calendar_services.get(source_account_name)
+            source_service = self._get_calendar_service(source_account_name)
 
             if not source_service:
                 self.logger.error(
@@ -188,9 +276,7 @@ class CalendarSynchronizer:
                 return False
 
             # Get enabled destinations
-            enabled_targets = [
-                target for target in sync_rule.destination if target.enabled
-            ]
+            enabled_targets = sync_rule.enabled_destinations
 
             if not enabled_targets:
                 self.logger.info(
@@ -240,7 +326,7 @@ class CalendarSynchronizer:
                         )
                         continue
 
-                    dest_service = self.calendar_services.get(dest_account_name)
+                    dest_service = self._get_calendar_service(dest_account_name)
                     if not dest_service:
                         self.logger.error(
                             f"❌ Calendar service not available for destination account: {dest_account_name}"
@@ -462,6 +548,10 @@ class CalendarSynchronizer:
         """Sync events to destination calendar with privacy rules."""
         synced_count = 0
 
+        # Events prepared for syncing, with their lookup requests; the API
+        # calls are then made in batches
+        pending: list[tuple[CalendarEvent, dict[str, Any], Any]] = []
+
         for event in source_events:
             try:
                 # Check Google Calendar event visibility to override privacy mode
@@ -486,9 +576,7 @@ class CalendarSynchronizer:
                     effective_identifier = "calsinki_synced"
 
                 # Get the instance-level identifier (without sync pair suffix)
-                instance_identifier = (
-                    getattr(self.config, "default_identifier", "calsinki") or "calsinki"
-                )
+                instance_identifier = self.config.default_identifier or "calsinki"
 
                 # Check if this source event is already a Calsinki-synced event to prevent loops
                 if self._is_calsinki_synced_event(event, instance_identifier):
@@ -527,30 +615,76 @@ class CalendarSynchronizer:
                     event_color,
                 )
 
-                # Check if event already exists in destination
-                existing_event = self._find_existing_event(
+                # Request to look for the event's existing copy in destination
+                lookup = self._existing_event_request(
                     dest_service, dest_calendar_id, event
                 )
+                pending.append((event, synced_event, lookup))
+
+            except Exception as e:
+                self.logger.error(f"❌ Failed to sync event {event.summary}: {e}")
+
+        # Check which events already exist in destination
+        existing_events: dict[int, dict[str, Any] | None] = {}
+        # Events whose lookup failed; creating them could duplicate a copy that
+        # is already there, so they are left for the next sync
+        failed_lookups: set[int] = set()
+
+        def on_lookup(index: int, response: Any, exception: Exception | None) -> None:
+            if exception is not None:
+                self.logger.error(
+                    f"❌ Failed to search for existing event "
+                    f"{pending[index][0].summary}: {exception}"
+                )
+                failed_lookups.add(index)
+                return
+            existing_events[index] = self._match_existing_event(
+                response, pending[index][0]
+            )
+
+        self._execute_batched(
+            dest_service,
+            [(index, lookup) for index, (_, _, lookup) in enumerate(pending)],
+            on_lookup,
+        )
 
+        # Update existing events and create the rest
+        writes = []
+        for index, (event, synced_event, _) in enumerate(pending):
+            if index in failed_lookups:
+                continue
+            try:
+                existing_event = existing_events.get(index)
                 if existing_event:
-                    # Update existing event
-                    self._update_event(
-                        dest_service,
-                        dest_calendar_id,
-                        existing_event["id"],
-                        synced_event,
+                    request = dest_service.events().update(
+                        calendarId=dest_calendar_id,
+                        eventId=existing_event["id"],
+                        body=synced_event,
                     )
-                    self.logger.debug(f"🔄 Updated event: {event.summary}")
                 else:
-                    # Create new event
-                    self._create_event(dest_service, dest_calendar_id, synced_event)
-                    self.logger.debug(f"➕ Created event: {event.summary}")
-
-                synced_count += 1
-
+                    request = dest_service.events().insert(
+                        calendarId=dest_calendar_id, body=synced_event
+                    )
+                writes.append((index, request))
             except Exception as e:
                 self.logger.error(f"❌ Failed to sync event {event.summary}: {e}")
 
+        def on_write(index: int, response: Any, exception: Exception | None) -> None:
+            nonlocal synced_count
+            event = pending[index][0]
+            if exception is not None:
+                self.logger.error(
+                    f"❌ Failed to sync event {event.summary}: {exception}"
+                )
+                return
+            if existing_events.get(index):
+                self.logger.debug(f"🔄 Updated event: {event.summary}")
+            else:
+                self.logger.debug(f"➕ Created event: {event.summary}")
+            synced_count += 1
+
+        self._execute_batched(dest_service, writes, on_write)
+
         return synced_count
 
     def _apply_privacy_rules(
@@ -681,72 +815,55 @@ class CalendarSynchronizer:
                 event_color,
             )
 
-    def _find_existing_event(
+    def _existing_event_request(
         self, service: Any, calendar_id: str, source_event: CalendarEvent
-    ) -> dict[str, Any] | None:
-        """Find existing event in destination calendar by checking sync metadata."""
-        try:
-            # Search for events with the same source event ID, regardless of time
-            # This allows us to find events even when the time has changed
-            source_event_id = source_event.event_id
-            source_calendar_id = source_event.sync_metadata["source_calendar_id"]
-
-            # Search for events with the source event ID in their metadata
-            # We'll search in a broader time range to catch events that may have moved
-            # Search in a wider time range (e.g., ±24 hours) to catch moved events
-            time_min = (source_event.start - timedelta(hours=24)).isoformat()
-            time_max = (source_event.end + timedelta(hours=24)).isoformat()
+    ) -> Any:
+        """Build the events.list request used to find a source event's copy."""
+        # Search for events with the source event ID in their metadata
+        # We'll search in a broader time range to catch events that may have moved
+        # Search in a wider time range (e.g., ±24 hours) to catch moved events
+        time_min = (source_event.start - timedelta(hours=24)).isoformat()
+        time_max = (source_event.end + timedelta(hours=24)).isoformat()
+
+        return service.events().list(
+            calendarId=calendar_id,
+            timeMin=time_min,
+            timeMax=time_max,
+            singleEvents=True,
+            maxResults=100,  # Limit results to avoid performance issues
+        )
 
-            events_result = (
-                service.events()
-                .list(
-                    calendarId=calendar_id,
-                    timeMin=time_min,
-                    timeMax=time_max,
-                    singleEvents=True,
-                    maxResults=100,  # Limit results to avoid performance issues
-                )
-                .execute()
-            )
+    def _match_existing_event(
+        self, events_result: dict[str, Any], source_event: CalendarEvent
+    ) -> dict[str, Any] | None:
+        """Pick the event synced from source_event out of an events.list result."""
+        # Search for events with the same source event ID, regardless of time
+        # This allows us to find events even when the time has changed
+        source_event_id = source_event.event_id
+        source_calendar_id = source_event.sync_metadata["source_calendar_id"]
 
-            events = events_result.get("items", [])
+        events: list[dict[str, Any]] = events_result.get("items", [])
 
-            # Check if any event has matching sync metadata
-            for event in events:
+        # Check if any event has matching sync metadata
+        for event in events:
+            if (
+                "extendedProperties" in event
+                and "private" in event["extendedProperties"]
+            ):
+                metadata = event["extendedProperties"]["private"]
                 if (
-                    "extendedProperties" in event
-                    and "private" in event["extendedProperties"]
+                    metadata.get("source_event_id") == source_event_id
+                    and metadata.get("source_calendar_id") == source_calendar_id
                 ):
-                    metadata = event["extendedProperties"]["private"]
-                    if (
-                        metadata.get("source_event_id") == source_event_id
-                        and metadata.get("source_calendar_id") == source_calendar_id
-                    ):
-                        self.logger.info(
-                            f"✅ Found existing event to update: {event.get('summary', 'Unknown')} (ID: {event.get('id', 'Unknown')})"
-                        )
-                        return event
-
-            self.logger.info(
-                f"ℹ️  No existing event found for source event {source_event_id}"
-            )
-            return None
-
-        except Exception as e:
-            self.logger.error(f"❌ Failed to search for existing event: {e}")
-            return None
-
-    def _create_event(self, service: Any, calendar_id: str, event_data: dict[str, Any]):
-        """Create a new event in the destination calendar."""
-        service.events().insert(calendarId=calendar_id, body=event_data).execute()
+                    self.logger.info(
+                        f"✅ Found existing event to update: {event.get('summary', 'Unknown')} (ID: {event.get('id', 'Unknown')})"
+                    )
+                    return event
 
-    def _update_event(
-        self, service: Any, calendar_id: str, event_id: str, event_data: dict[str, Any]
-    ):
-        """Update an existing event in the destination calendar."""
-        service.events().update(
-            calendarId=calendar_id, eventId=event_id, body=event_data
-        ).execute()
+        self.logger.info(
+            f"ℹ️  No existing event found for source event {source_event_id}"
+        )
+        return None
 
     def _get_effective_privacy_mode(
         self, event: CalendarEvent, configured_privacy_mode: str
@@ -952,6 +1069,9 @@ class CalendarSynchronizer:
 
         # Create a set of source event IDs for fast lookup
         source_event_ids = {event.event_id for event in source_events}
+
+        # Delete requests, sent in batches once every event has been checked
+        deletions: list[tuple[str, Any]] = []
         self.logger.info(f"📋 Source event IDs: {source_event_ids}")
 
         for synced_event in existing_synced_events:
@@ -982,20 +1102,23 @@ class CalendarSynchronizer:
                         event_id = synced_event.sync_metadata.get("source_event_id")
 
                     if event_id:
-                        dest_service.events().delete(
-                            calendarId=dest_calendar_id, eventId=event_id
-                        ).execute()
-                        print(f"🗑️  Successfully deleted event '{event_summary}'")
-                        self.logger.info(
-                            f"✅ Successfully deleted event '{event_summary}'"
-                        )
-                    else:
-                        print(
-                            f"⚠️  Could not delete event '{event_summary}' - missing event ID"
-                        )
-                        self.logger.warning(
-                            f"⚠️  Could not delete event '{event_summary}' - missing event ID"
+                        # Sent below, together with the other deletions
+                        deletions.append(
+                            (
+                                event_summary,
+                                dest_service.events().delete(
+                                    calendarId=dest_calendar_id, eventId=event_id
+                                ),
+                            )
                         )
+                        continue
+
+                    print(
+                        f"⚠️  Could not delete event '{event_summary}' - missing event ID"
+                    )
+                    self.logger.warning(
+                        f"⚠️  Could not delete event '{event_summary}' - missing event ID"
+                    )
 
                     deleted_count += 1
                     self.logger.info(
@@ -1011,6 +1134,24 @@ class CalendarSynchronizer:
                     f"❌ Failed to process event {synced_event.summary}: {e}"
                 )
 
+        def on_delete(
+            event_summary: str, response: Any, exception: Exception | None
+        ) -> None:
+            nonlocal deleted_count
+            if exception is not None:
+                self.logger.error(
+                    f"❌ Failed to process event {event_summary}: {exception}"
+                )
+                return
+            print(f"🗑️  Successfully deleted event '{event_summary}'")
+            self.logger.info(f"✅ Successfully deleted event '{event_summary}'")
+            deleted_count += 1
+            self.logger.info(
+                f"✅ Successfully identified event '{event_summary}' for deletion"
+            )
+
+        self._execute_batched(dest_service, deletions, on_delete)
+
         self.logger.info(
             f"🗑️  Deletion check complete: {deleted_count} events identified for deletion"
         )
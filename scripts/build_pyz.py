@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Build a single-file zipapp (PEP 441) of the calsinki CLI.
+The archive ships precompiled bytecode so imports skip compilation.
+"""
+
+import argparse
+import compileall
+import shutil
+import sys
+import tempfile
+import zipapp
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# zipapp's own main= stub discards the return value, so the archive brings its
+# own entry point that turns main()'s result into the process exit status
+MAIN_PY = """\
+import sys
+
+from calsinki.cli import main
+
+sys.exit(main())
+"""
+
+
+def build_pyz(output: Path, optimize: int = 2, compress: bool = True) -> Path:
+    """Build calsinki.pyz from the package sources."""
+    with tempfile.TemporaryDirectory() as staging:
+        staging_dir = Path(staging)
+        shutil.copytree(
+            PROJECT_ROOT / "calsinki",
+            staging_dir / "calsinki",
+            ignore=shutil.ignore_patterns("__pycache__", "*.pyc"),
+        )
+        (staging_dir / "__main__.py").write_text(MAIN_PY)
+
+        # zipimport never looks in __pycache__, so bytecode is written next to
+        # the sources (legacy layout) where it will be picked up
+        if not compileall.compile_dir(
+            staging_dir, quiet=1, legacy=True, optimize=optimize
+        ):
+            raise RuntimeError("Failed to compile calsinki sources")
+
+        zipapp.create_archive(
+            staging_dir,
+            target=output,
+            interpreter="/usr/bin/env python3",
+            compressed=compress,
+        )
+
+    return output
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build a calsinki.pyz zipapp with precompiled bytecode"
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=PROJECT_ROOT / "calsinki.pyz",
+        help="Archive to create (default: calsinki.pyz in the project root)",
+    )
+    parser.add_argument(
+        "--optimize",
+        type=int,
+        choices=(0, 1, 2),
+        default=2,
+        help="Bytecode optimization level, as for python -O/-OO (default: 2)",
+    )
+    parser.add_argument(
+        "--no-compress",
+        action="store_true",
+        help="Store files uncompressed (slightly larger, slightly faster to load)",
+    )
+    args = parser.parse_args()
+
+    try:
+        output = build_pyz(args.output, args.optimize, not args.no_compress)
+    except Exception as e:
+        print(f"❌ Failed to build zipapp: {e}")
+        return 1
+
+    print(f"✅ Built {output}")
+    print(f"💡 Run it with: python {output} --version")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""Tests for the zipapp build script."""
+
+import importlib.util
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _load_build_pyz():
+    spec = importlib.util.spec_from_file_location(
+        "build_pyz", PROJECT_ROOT / "scripts" / "build_pyz.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class BuildPyzTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = Path(tempfile.mkdtemp())
+        self.archive = _load_build_pyz().build_pyz(self.tmp_dir / "calsinki.pyz")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def run_archive(self, *args):
+        env = dict(os.environ, XDG_CONFIG_HOME=str(self.tmp_dir / "config"))
+        return subprocess.run(
+            [sys.executable, str(self.archive), *args],
+            capture_output=True,
+            text=True,
+            env=env,
+        )
+
+    def test_success_exits_zero(self):
+        result = self.run_archive("--version")
+        self.assertEqual(result.returncode, 0)
+        self.assertIn("Calsinki", result.stdout)
+
+    def test_failure_exit_code_is_propagated(self):
+        # No config file exists under the temporary XDG_CONFIG_HOME
+        result = self.run_archive("config")
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("Configuration file not found", result.stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+"""Tests for the command-line argument parsing."""
+
+import unittest
+
+from calsinki import auth, cli
+from calsinki.cli import _FAST_FLAGS, _SUBCOMMANDS, _build_parser, _fast_parse_args
+
+
+class FastParseArgsTest(unittest.TestCase):
+    """_fast_parse_args() must produce the namespace argparse would."""
+
+    def assert_matches_argparse(self, argv):
+        fast_args = _fast_parse_args(argv)
+        self.assertIsNotNone(fast_args, argv)
+        self.assertEqual(vars(fast_args), vars(_build_parser().parse_args(argv)))
+
+    def test_flag_free_invocations(self):
+        for command in _SUBCOMMANDS:
+            with self.subTest(command=command):
+                self.assert_matches_argparse([command])
+
+    def test_each_flag(self):
+        for command, flags in _FAST_FLAGS.items():
+            for flag in flags:
+                with self.subTest(command=command, flag=flag):
+                    self.assert_matches_argparse([command, flag])
+
+    def test_global_options(self):
+        for command in _SUBCOMMANDS:
+            with self.subTest(command=command):
+                self.assert_matches_argparse(
+                    ["--no-config-cache", "--config", "other.yaml", command]
+                )
+
+    def test_positionals(self):
+        self.assert_matches_argparse(["sync", "rule_a", "rule_b", "--dry-run"])
+        self.assert_matches_argparse(["auth", "personal", "work"])
+
+
+class SharedConstantsTest(unittest.TestCase):
+    """cli keeps its own copies so that it needn't import calsinki.auth."""
+
+    def test_auth_parallel_limit_matches_refresh_pool(self):
+        self.assertEqual(cli._MAX_AUTH_PARALLEL, auth.REFRESH_POOL_SIZE)
+
+    def test_banners_match(self):
+        self.assertEqual(cli._BANNER, auth._QR_BANNER)
+
+
+if __name__ == "__main__":
+    unittest.main()